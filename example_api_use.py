@@ -1,12 +1,13 @@
 import asyncio
 import json
 import logging
+import random
 import sys
+import time
 
-from dataclasses import asdict
 from datetime import datetime
 
-from aiodabpumps import DabPumpsApi
+from aiodabpumps import DabPumpsApi, DabPumpsApiConnectError, dataclass_fields
 
 # Setup logging to StdOut
 logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
@@ -26,11 +27,11 @@ from tests import TEST_USERNAME, TEST_PASSWORD
 async def main():
     api = None
     try:
-        # Process these calls in the right order
         api = DabPumpsApi(TEST_USERNAME, TEST_PASSWORD)
-        await api.async_login()
 
-        # Retrieve translations (optional)
+        # Login and retrieve translations, the installation list and all installation
+        # details (devices, configuration meta data and initial statuses per device)
+        # in one call; independent fetches are performed in parallel.
         # Possible languages:
         #    "cs": "Czech",
         #    "nl": "Dutch",
@@ -44,11 +45,7 @@ async def main():
         #    "sk": "Slovenian",
         #    "es": "Spanish",
         #    "sf": "Swedish",
-        await api.async_fetch_strings('en')
-
-        # Retrieve installations accessible by this user.
-        # Usually only one and you can skip this call if you already know the install_id
-        await api.async_fetch_install_list()
+        await api.async_refresh_all(lang='en')
 
         logger.info(f"installs: {len(api.install_map)}")
 
@@ -56,19 +53,16 @@ async def main():
             logger.info("")
             logger.info(f"installation: {install.name} ({install.id})")
 
-            # Retrieve installation details
-            # This includes the list of devices, configuration meta data for each device
-            # and initial statuses for each device
-            await api.async_fetch_install_details(install_id)
-
         logger.info(f"devices: {len(api.device_map)}")
 
         for device in api.device_map.values():
             # Log the retrieved info
             logger.info("")
             logger.info(f"device: {device.name} ({device.serial})")                
-            for k,v in asdict(device).items():
-                logger.info(f"    {k}: {v}")
+            # Iterate the dataclass fields directly; asdict() would make a deep
+            # recursive copy of the device just to log it
+            for f in dataclass_fields(type(device)):
+                logger.info(f"    {f.name}: {getattr(device, f.name)}")
 
             config = api.config_map[device.config_id]                     
             logger.info("")
@@ -78,18 +72,38 @@ async def main():
             #    logger.info(f"        {k}: {v}")
 
         # Once the calls above have been perfomed, the calls below can be repeated periodically.
+        # Poll on fixed 60 second boundaries; deriving the sleep from a monotonic deadline
+        # prevents the fetch time from accumulating as drift over the hour.
+        deadline = time.monotonic()
         for t in range(60):
-            # Regularly repeat the login call to make sure the access-token is renewed when needed.
-            await api.async_login()
-
-            # Retrieve fresh statuses for all devices in this install
-            await api.async_fetch_install_statuses(install_id)
+            # Retry transient connection problems with exponential backoff and jitter,
+            # so a one-off server blip does not abort the whole polling loop.
+            # Authentication errors are not retried.
+            for attempt in range(3):
+                try:
+                    # Regularly repeat the login call to make sure the access-token is renewed when needed.
+                    await api.async_login()
+
+                    # Retrieve fresh statuses for all devices in this install
+                    await api.async_fetch_install_statuses(install_id)
+                    break
+
+                except DabPumpsApiConnectError as e:
+                    if attempt == 2:
+                        raise
+                    backoff = 0.25 * 2**attempt + random.random() * 0.25
+                    logger.info(f"transient error, retry in {backoff:.2f}s: {e}")
+                    await asyncio.sleep(backoff)
 
             for device in api.device_map.values():
-                device_statuses = { k:v for k,v in api.status_map.items() if v.serial==device.serial }
+                device_statuses = api.statuses_for(device.serial)
                 logger.info("")
                 logger.info(f"statuses for {device.name}: {len(device_statuses)}")
 
+                # Skip building the per-status f-strings when INFO logging is off
+                if not logger.isEnabledFor(logging.INFO):
+                    continue
+
                 for k,v in device_statuses.items():
                     value_with_unit = f"{v.value} {v.unit}" if v.unit is not None else v.value
 
@@ -100,10 +114,11 @@ async def main():
                         # Display real-life value, original encoded value is the same
                         logger.info(f"    {v.name}: {value_with_unit}")
 
-            # Wait one minute and retrieve install statuses again
+            # Wait until the next minute boundary and retrieve install statuses again
             logger.info("")
             logger.info(f"wait ({datetime.now().strftime("%H:%M")})")
-            await asyncio.sleep(60)
+            deadline += 60
+            await asyncio.sleep(max(0, deadline - time.monotonic()))
 
     except Exception as e:
         logger.info(f"Unexpected exception: {e}")
@@ -1,9 +1,10 @@
 from .dabpumps_api import (
-    DabPumpsApi, 
-    DabPumpsApiConnectError, 
-    DabPumpsApiAuthError, 
-    DabPumpsApiDataError, 
-    DabPumpsApiError, 
+    DabPumpsApi,
+    DabPumpsApiConnectError,
+    DabPumpsApiAuthError,
+    DabPumpsApiDataError,
+    DabPumpsApiError,
+    DabPumpsLogin,
 )
 from .dabpumps_data import (
     DabPumpsUserRole,
@@ -16,13 +17,35 @@ from .dabpumps_data import (
     DabPumpsHistoryItem,
     DabPumpsHistoryDetail,
     DabPumpsDictFactory,
+    dataclass_fields,
 )
 
-# for unit tests
-from  .dabpumps_client import (
-    DabPumpsClient_Httpx, 
-    DabPumpsClient_Aiohttp,
-)
-from .dabpumps_api import (
-    DabPumpsLogin,
-)
+__all__ = [
+    "DabPumpsApi",
+    "DabPumpsApiConnectError",
+    "DabPumpsApiAuthError",
+    "DabPumpsApiDataError",
+    "DabPumpsApiError",
+    "DabPumpsLogin",
+    "DabPumpsClient_Httpx",
+    "DabPumpsClient_Aiohttp",
+    "DabPumpsUserRole",
+    "DabPumpsParamType",
+    "DabPumpsInstall",
+    "DabPumpsDevice",
+    "DabPumpsConfig",
+    "DabPumpsParams",
+    "DabPumpsStatus",
+    "DabPumpsHistoryItem",
+    "DabPumpsHistoryDetail",
+    "DabPumpsDictFactory",
+    "dataclass_fields",
+]
+
+
+def __getattr__(name):
+    """Lazily resolve the client shims (PEP 562); mainly used by unit tests"""
+    if name in ("DabPumpsClient_Httpx", "DabPumpsClient_Aiohttp"):
+        from . import dabpumps_client
+        return getattr(dabpumps_client, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
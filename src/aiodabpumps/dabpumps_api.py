@@ -1,23 +1,21 @@
 """api.py: DabPumps API for DAB Pumps integration."""
 
 import base64
-import copy
 import hashlib
 import jwt
 import math
 import os
-import warnings
 import aiohttp
 import asyncio
 import httpx
-import json
 import logging
+import random
 import re
-import time
+import sys
 
 from dataclasses import replace
 from datetime import datetime, timedelta, timezone
-from enum import Enum, StrEnum
+from enum import StrEnum
 from typing import Any
 from urllib.parse import urlparse, parse_qs
 from yarl import URL
@@ -31,7 +29,6 @@ from .dabpumps_const import (
     DCONNECT_ACCESS_TOKEN_VALID,
     DCONNECT_REFRESH_TOKEN_COOKIE,
     DCONNECT_REFRESH_TOKEN_VALID,
-    DABCS_INIT_URL,
     DABCS_API_URL,
     DABCS_API_DOMAIN,
     DABCS_ACCESS_TOKEN_VALID,
@@ -44,12 +41,16 @@ from .dabpumps_const import (
     DCONNECT_APP_CLIENT_ID,
     DCONNECT_APP_CLIENT_SECRET,
     DCONNECT_APP_USER_AGENT,
+    CONFIG_CACHE_VALID,
+    MAX_CONCURRENT_REQUESTS,
+    REQUEST_RETRY_ATTEMPTS,
     STATUS_UPDATE_HOLD,
 )
 
 from .dabpumps_client import (
     DabPumpsClient_Httpx,
     DabPumpsClient_Aiohttp,
+    _json_loads,
 )
 from .dabpumps_data import (
     DabPumpsUserRole,
@@ -65,6 +66,54 @@ from .dabpumps_data import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Precompiled pattern; the login pages are parsed on every (re-)login
+_ACTION_URL_RE = re.compile(r'action\s?=\s?\"(.*?)\"', re.MULTILINE)
+
+
+class _IdTranslateTable(dict):
+    """Translation table for create_id; unknown characters map to None (dropped)"""
+    def __missing__(self, codepoint):
+        return None
+
+# Keeps [a-z0-9_-], turns spaces into underscores and drops everything else,
+# all in one C-level str.translate pass
+_ID_TRANS = _IdTranslateTable({ ord(c): c for c in 'abcdefghijklmnopqrstuvwxyz0123456789_-' })
+_ID_TRANS[ord(' ')] = '_'
+
+
+# Server 'code' values that indicate an authorization problem rather than a transient error
+_AUTH_ERROR_CODES = frozenset(('FORBIDDEN', 'WRONGCREDENTIAL'))
+
+# Header templates; request sites take a shallow copy since _async_send_request
+# adds authorization and default headers to the request's headers dict
+_FORM_HEADERS = { 'Content-Type': 'application/x-www-form-urlencoded' }
+_JSON_HEADERS = { 'Content-Type': 'application/json' }
+
+# Pre-parsed base urls; extending a yarl.URL appends path segments without
+# re-parsing the whole url string, and the clients accept the URL object as-is
+_DABSSO_BASE = URL(DABSSO_API_URL)
+_DABCS_BASE = URL(DABCS_API_URL)
+_DCONNECT_BASE = URL(DCONNECT_API_URL)
+
+# Translations URL split once around the language code; fetching strings for a
+# language is then a plain concat instead of re-parsing the URL template
+_TRANSLATIONS_URL_PREFIX = f"{DCONNECT_API_URL}/resources/js/localization_"
+_TRANSLATIONS_URL_SUFFIX = ".properties?format=JSON&fullmerge=1"
+
+
+def _first_chars(items) -> str:
+    """Concatenate the first character of each string, e.g. ['Customer','Installer'] -> 'CI'"""
+    return ''.join(s[0] for s in items) if items else ''
+
+
+def _first(d: dict, *keys, default=''):
+    """Return the first truthy value among the given keys, stopping at the first hit"""
+    for k in keys:
+        v = d.get(k)
+        if v:
+            return v
+    return default
+
 
 class DabPumpsLogin(StrEnum):
     ACCESS_TOKEN = 'Access-Token'
@@ -87,7 +136,7 @@ class DabPumpsAuth(StrEnum):
 # DabPumpsAPI to detect device and get device info, fetch the actual data from the device, and parse it
 class DabPumpsApi:
     
-    def __init__(self, username, password, client:httpx.AsyncClient|aiohttp.ClientSession|None = None):
+    def __init__(self, username, password, client:httpx.AsyncClient|aiohttp.ClientSession|None = None, max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS):
         # Configuration
         self._username: str = username
         self._password: str = password
@@ -95,6 +144,10 @@ class DabPumpsApi:
         # Login data
         self._login_time: datetime|None = None
         self._login_method: DabPumpsLogin|None = None
+
+        # Login methods that were rejected with an authorization error for the
+        # credentials of this instance; skipped on subsequent login attempts
+        self._auth_failed_methods: set[DabPumpsLogin] = set()
         self._fetch_method: DabPumpsFetch|None = None
         self._auth_method: DabPumpsAuth|None = None
         self._extra_headers = {}
@@ -108,15 +161,23 @@ class DabPumpsApi:
         self._refresh_client_id = None
         self._refresh_client_secret = None
 
+        # Tokens that already passed the jwt decode check in _validate_token
+        self._validated_tokens: set[str] = set()
+
         # Retrieved data
         self._install_map: dict[str, DabPumpsInstall] = {}
         self._device_map: dict[str, DabPumpsDevice] = {}
         self._config_map: dict[str, DabPumpsConfig] = {}
+        self._config_fetch_ts: dict[str, datetime] = {}
         self._status_actual_map: dict[str, DabPumpsStatus] = {}
         self._status_static_map: dict[str, DabPumpsStatus] = {}
+        self._status_keys_by_serial: dict[str, set[str]] = {}
         self._string_map: dict[str, str] = {}
         self._string_map_lang: str = None
 
+        # Cache of (etag, parsed result) per GET url, used for conditional requests
+        self._etag_cache: dict[str, tuple[str, Any]] = {}
+
         self._install_map_ts: datetime = datetime.min
         self._device_map_ts: datetime = datetime.min
         self._device_detail_ts: datetime = datetime.min
@@ -128,15 +189,15 @@ class DabPumpsApi:
         # Client (aiohttp or httpx) to keep track of cookies during login and subsequent calls
         # We keep the same client for the whole life of the api instance.
         if isinstance(client, httpx.AsyncClient):
-            _LOGGER.debug(f"using passed httpx client")
+            _LOGGER.debug("using passed httpx client")
             self._client = DabPumpsClient_Httpx(client)
 
         elif isinstance(client, aiohttp.ClientSession):
-            _LOGGER.debug(f"using passed aiohttp client")
+            _LOGGER.debug("using passed aiohttp client")
             self._client = DabPumpsClient_Aiohttp(client)
 
         else:
-            _LOGGER.debug(f"using new aiohttp client")
+            _LOGGER.debug("using new aiohttp client")
             self._client = DabPumpsClient_Aiohttp()
             #
             #_LOGGER.debug(f"using new httpx client")
@@ -145,6 +206,10 @@ class DabPumpsApi:
         # Locks to protect certain operations from being called from multiple threads
         self._login_lock = asyncio.Lock()
 
+        # Bound the number of simultaneous requests so callers can safely gather
+        # many fetches without hitting server side throttling
+        self._request_semaphore = asyncio.Semaphore(max_concurrent_requests)
+
         # To pass diagnostics data back to our parent
         self._diagnostics_callback = None
 
@@ -155,10 +220,8 @@ class DabPumpsApi:
 
     @staticmethod
     def create_id(*args):
-        str = '_'.join(args).strip('_')
-        str = re.sub(' ', '_', str)
-        str = re.sub('[^a-z0-9_-]+', '', str.lower())
-        return str            
+        id = '_'.join(args).strip('_')
+        return id.lower().translate(_ID_TRANS)
     
     
     @property
@@ -181,6 +244,19 @@ class DabPumpsApi:
     def status_map(self) -> dict[str, DabPumpsStatus]:
         return self._status_static_map | self._status_actual_map
     
+    def statuses_for(self, serial: str) -> dict[str, DabPumpsStatus]:
+        """
+        Return the statuses for one device, keyed by status_key.
+        Uses an index by device serial, avoiding a scan of the whole status_map.
+        """
+        statuses = {}
+        for status_key in self._status_keys_by_serial.get(serial, ()):
+            status = self._status_actual_map.get(status_key) or self._status_static_map.get(status_key)
+            if status is not None:
+                statuses[status_key] = status
+
+        return statuses
+
     @property
     def string_map(self) -> dict[str, str]:
         return self._string_map
@@ -226,12 +302,27 @@ class DabPumpsApi:
             await self._client.async_close()
 
 
+    async def __aenter__(self):
+        return self
+
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.async_close()
+
+
     async def async_login(self):
         """
         Login to DAB Pumps by trying each of the possible login methods.
         Guards for calls from multiple threads.
         """
 
+        # Fast path: when authenticating via Authorization header and the access-token
+        # is still valid, there is nothing to do. This makes the periodic async_login
+        # calls from a polling loop essentially free until the token nears expiry.
+        if self._auth_method == DabPumpsAuth.HEADER and self._access_token and \
+           self._access_expiry and datetime.now() < self._access_expiry:
+            return
+
         # Only one thread at a time can check token cookie and do subsequent login if needed.
         # Once one thread is done, the next thread can then check the (new) token cookie.
         async with self._login_lock:
@@ -247,8 +338,27 @@ class DabPumpsApi:
         # Then, try the method that succeeded last time!
         # Finally try all logig methods
         error = None
-        methods = [DabPumpsLogin.ACCESS_TOKEN, DabPumpsLogin.REFRESH_TOKEN, self._login_method, DabPumpsLogin.H2D_APP, DabPumpsLogin.DABLIVE_APP_1, DabPumpsLogin.DABLIVE_APP_0, DabPumpsLogin.DCONNECT_APP, DabPumpsLogin.DCONNECT_WEB]
+        # dict.fromkeys dedupes while keeping order, so the method that succeeded
+        # last time is not tried a second time in the fallback sequence
+        methods = dict.fromkeys([DabPumpsLogin.ACCESS_TOKEN, DabPumpsLogin.REFRESH_TOKEN, self._login_method, DabPumpsLogin.H2D_APP, DabPumpsLogin.DABLIVE_APP_1, DabPumpsLogin.DABLIVE_APP_0, DabPumpsLogin.DCONNECT_APP, DabPumpsLogin.DCONNECT_WEB])
+
+        # When every fresh credential based method is on the known-bad list there is
+        # nothing left to skip for. Authorization errors can also be transient (the
+        # server blocks a route or rate limits), so forget the list and run the full
+        # chain once more rather than failing permanently until a restart.
+        fresh_methods = [m for m in methods if m is not None and m not in (DabPumpsLogin.ACCESS_TOKEN, DabPumpsLogin.REFRESH_TOKEN)]
+        if all(m in self._auth_failed_methods for m in fresh_methods):
+            self._auth_failed_methods.clear()
+
         for method in methods:
+            # Skip methods that were already rejected with an authorization error
+            # on an earlier login attempt; retrying them with the same credentials
+            # only triggers rate limiting on the server. Within a single pass every
+            # method is still tried once, because the methods hit different backends
+            # with different account stores and one can succeed where another fails.
+            if method in self._auth_failed_methods:
+                continue
+
             try:
                 match method:
                     case DabPumpsLogin.ACCESS_TOKEN:
@@ -286,6 +396,12 @@ class DabPumpsApi:
                 # Clear any previous login cookies and tokens before trying the next method
                 await self._async_logout(context="login", method=method)
 
+                # Remember fresh credential based logins that were rejected with an
+                # authorization error, so the next login attempt skips them
+                if isinstance(ex, DabPumpsApiAuthError) and \
+                   method not in (DabPumpsLogin.ACCESS_TOKEN, DabPumpsLogin.REFRESH_TOKEN):
+                    self._auth_failed_methods.add(method)
+
         # if we reached this point then all methods failed.
         if error:
             raise error
@@ -306,7 +422,7 @@ class DabPumpsApi:
         # Dab Pumps seems to ignore the expiry field inside the token, using only
         # the expires_in field that was passed alongside the token.
         if datetime.now() > self._access_expiry:
-            _LOGGER.debug(f"Access-Token expired")
+            _LOGGER.debug("Access-Token expired")
             return False    # silently continue to the next login method (token refresh)
 
         # Re-use this access token
@@ -318,7 +434,7 @@ class DabPumpsApi:
         }
         await self._async_update_diagnostics(datetime.now(), context, None, None, token)
 
-        _LOGGER.debug(f"Reuse the access-token")
+        _LOGGER.debug("Reuse the access-token")
         return True
 
 
@@ -340,15 +456,13 @@ class DabPumpsApi:
             # have expired; silently continue to the next login method 
             return False
         
-        # Don't bother to check the contents of the refresh token, 
+        # Don't bother to check the contents of the refresh token,
         # just attempt to request a new access token via the refresh token
         context = f"login access_token refresh"
         request = {
             "method": "POST",
-            "url": DABSSO_API_URL + '/auth/realms/dwt-group/protocol/openid-connect/token',
-            "headers": {
-                'Content-Type': 'application/x-www-form-urlencoded',
-            },
+            "url": _DABSSO_BASE / 'auth/realms/dwt-group/protocol/openid-connect/token',
+            "headers": dict(_FORM_HEADERS),
             "data": {
                 'grant_type': 'refresh_token',
                 'refresh_token': self._refresh_token, 
@@ -357,26 +471,20 @@ class DabPumpsApi:
             },
         }
         
-        _LOGGER.debug(f"Try refresh the access-token; authenticate via {request["method"]} {request["url"]}")
+        _LOGGER.debug("Try refresh the access-token; authenticate via %s %s", request["method"], request["url"])
         result = await self._async_send_request(context, request)
 
         # Store access-token in variable so it will be added as Authorization header in calls to DABCS and DConnect
         # We do not need to store the new access-token as cookie, those take care of their own refresh
-        self._access_token = self._validate_token( result.get('access_token') )
-        self._access_expires_in = self._validate_expires_in( result.get('expires_in'), DCONNECT_ACCESS_TOKEN_VALID )
-        self._access_expiry = self._calculate_expiry(self._access_expires_in)
-
-        self._refresh_token = self._validate_token( result.get('refresh_token') )
-        self._refresh_expires_in = self._validate_expires_in( result.get('refresh_expires_in'), DCONNECT_REFRESH_TOKEN_VALID)
-        self._refresh_expiry = self._calculate_expiry(self._refresh_expires_in)
-
-        if not self._access_token or not self._refresh_token:
-            error = f"No tokens found in response from {request["url"]}"
-            _LOGGER.debug(error)    # logged as warning after last retry
-            raise DabPumpsApiAuthError(error)
+        self._store_tokens(result, request["url"],
+            access_token_valid = DCONNECT_ACCESS_TOKEN_VALID,
+            refresh_token_valid = DCONNECT_REFRESH_TOKEN_VALID,
+            client_id = self._refresh_client_id,
+            client_secret = self._refresh_client_secret,
+            require_refresh = True)
 
         # The refresh of the tokens succeeded
-        _LOGGER.debug(f"Refreshed the access-token; original login used method {self._login_method}")
+        _LOGGER.debug("Refreshed the access-token; original login used method %s", self._login_method)
         return True
 
 
@@ -399,7 +507,7 @@ class DabPumpsApi:
         context = f"login H2D_app openid-connect auth"
         request = {
             "method": "GET",
-            "url": DABSSO_API_URL + '/auth/realms/dwt-group/protocol/openid-connect/auth',
+            "url": _DABSSO_BASE / 'auth/realms/dwt-group/protocol/openid-connect/auth',
             'params': {
                 'client_id': openid_client_id,
                 'response_type': 'code',
@@ -411,10 +519,10 @@ class DabPumpsApi:
             },
         }
 
-        _LOGGER.debug(f"Try login with H2D; retrieve auth page via {request["method"]}  {request["url"]}")
+        _LOGGER.debug("Try login with H2D; retrieve auth page via %s  %s", request["method"], request["url"])
         text = await self._async_send_request(context, request)
         
-        match = re.search(r'action\s?=\s?\"(.*?)\"', text, re.MULTILINE)
+        match = _ACTION_URL_RE.search(text)
         if not match:    
             error = f"Unexpected response while retrieving openid-connect from {request["url"]}: {text}"
             _LOGGER.debug(error)    # logged as warning after last retry
@@ -425,9 +533,7 @@ class DabPumpsApi:
         request = {
             "method": "POST",
             "url": match.group(1).replace('&amp;', '&'),
-            "headers": {
-                'Content-Type': 'application/x-www-form-urlencoded',
-            },
+            "headers": dict(_FORM_HEADERS),
             "data": {
                 'username': self._username, 
                 'password': self._password,
@@ -437,7 +543,7 @@ class DabPumpsApi:
             }
         }
         
-        _LOGGER.debug(f"Try login with H2D; authenticate '{self._username}' via {request["method"]} {request["url"]}")
+        _LOGGER.debug("Try login with H2D; authenticate '%s' via %s %s", self._username, request["method"], request["url"])
         location_str = await self._async_send_request(context, request)
 
         # Returned value is a redirect location containing state and session_state
@@ -451,16 +557,14 @@ class DabPumpsApi:
         openid_code = parse_qs(location_url.query).get('code')[0]
 
         if openid_state_rsp != openid_state_req:
-            _LOGGER.debug(f"Unexpected state value in response while authenticating: '{openid_state_rsp}', expected '{openid_state_req}")
+            _LOGGER.debug("Unexpected state value in response while authenticating: '%s', expected '%s", openid_state_rsp, openid_state_req)
 
         # Step 3: Get Access and Refresh Tokens
         context = f"login H2D_app openid-connect token"
         request = {
             "method": "POST",
-            "url": DABSSO_API_URL + '/auth/realms/dwt-group/protocol/openid-connect/token',
-            "headers": {
-                'Content-Type': 'application/x-www-form-urlencoded',
-            },
+            "url": _DABSSO_BASE / 'auth/realms/dwt-group/protocol/openid-connect/token',
+            "headers": dict(_FORM_HEADERS),
             "data": {
                 'grant_type': 'authorization_code',
                 'code': openid_code, 
@@ -470,23 +574,14 @@ class DabPumpsApi:
             },
         }
         
-        _LOGGER.debug(f"Try login with H2D; retrieve tokens via {request["method"]} {request["url"]}")
+        _LOGGER.debug("Try login with H2D; retrieve tokens via %s %s", request["method"], request["url"])
         result = await self._async_send_request(context, request)
 
-        self._access_token = self._validate_token( result.get('access_token') )
-        self._access_expires_in = self._validate_expires_in( result.get('expires_in'), DABCS_ACCESS_TOKEN_VALID )
-        self._access_expiry = self._calculate_expiry(self._access_expires_in)
-
-        self._refresh_token = self._validate_token( result.get('refresh_token') )
-        self._refresh_expires_in = self._validate_expires_in( result.get('refresh_expires_in'), DABCS_REFRESH_TOKEN_VALID)
-        self._refresh_expiry = self._calculate_expiry(self._refresh_expires_in)
-        self._refresh_client_id = openid_client_id
-        self._refresh_client_secret = openid_client_secret
-
-        if not self._access_token:
-            error = f"No tokens found in response from {request["url"]}"
-            _LOGGER.debug(error)    # logged as warning after last retry
-            raise DabPumpsApiAuthError(error)
+        self._store_tokens(result, request["url"],
+            access_token_valid = DABCS_ACCESS_TOKEN_VALID,
+            refresh_token_valid = DABCS_REFRESH_TOKEN_VALID,
+            client_id = openid_client_id,
+            client_secret = openid_client_secret)
 
         # if we reach this point then the token was OK
         self._login_time = datetime.now()
@@ -495,7 +590,7 @@ class DabPumpsApi:
         self._auth_method = DabPumpsAuth.HEADER
         self._extra_headers = {}
 
-        _LOGGER.debug(f"Login succeeded using method {self._login_method}")
+        _LOGGER.debug("Login succeeded using method %s", self._login_method)
         return True
 
         
@@ -506,36 +601,24 @@ class DabPumpsApi:
         context = f"login via DabLive App (isDabLive={isDabLive})"
         request = {
             "method": "POST",
-            "url": DCONNECT_API_URL + f"/auth/token",
+            "url": _DCONNECT_BASE / 'auth/token',
             "params": {
                 'isDabLive': isDabLive,     # required param, though actual value seems to be completely ignored
             },
-            "headers": {
-                'Content-Type': 'application/x-www-form-urlencoded',
-            },
+            "headers": dict(_FORM_HEADERS),
             "data": {
                 'username': self._username, 
                 'password': self._password,
             },
         }
         
-        _LOGGER.debug(f"Try login with DabLive; authenticate '{self._username}' via {request["method"]} {request["url"]} with isDabLive={isDabLive}")
+        _LOGGER.debug("Try login with DabLive; authenticate '%s' via %s %s with isDabLive=%s", self._username, request["method"], request["url"], isDabLive)
         result = await self._async_send_request(context, request)
 
-        self._access_token = self._validate_token( result.get('access_token') )
-        self._access_expires_in = self._validate_expires_in( result.get('expires_in'), DCONNECT_ACCESS_TOKEN_VALID )
-        self._access_expiry = self._calculate_expiry(self._access_expires_in)
-
-        self._refresh_token = self._validate_token( result.get('refresh_token') )    # expected to be empty
-        self._refresh_expires_in = self._validate_expires_in( result.get('refresh_expires_in'), DCONNECT_REFRESH_TOKEN_VALID)
-        self._refresh_expiry = self._calculate_expiry(self._refresh_expires_in)
-        self._refresh_client_id = None
-        self._refresh_client_secret = None
-
-        if not self._access_token:
-            error = f"No tokens found in response from {request["url"]}"
-            _LOGGER.debug(error)    # logged as warning after last retry
-            raise DabPumpsApiAuthError(error)
+        # Note: the refresh token is expected to be empty for this method
+        self._store_tokens(result, request["url"],
+            access_token_valid = DCONNECT_ACCESS_TOKEN_VALID,
+            refresh_token_valid = DCONNECT_REFRESH_TOKEN_VALID)
 
         # if we reach this point then the token was OK
         self._login_time = datetime.now()
@@ -544,7 +627,7 @@ class DabPumpsApi:
         self._auth_method = DabPumpsAuth.HEADER
         self._extra_headers = {}
 
-        _LOGGER.debug(f"Login succeeded using method {self._login_method}")
+        _LOGGER.debug("Login succeeded using method %s", self._login_method)
         return True
 
         
@@ -558,10 +641,8 @@ class DabPumpsApi:
         context = f"login DConnect_app"
         request = {
             "method": "POST",
-            "url": DABSSO_API_URL + f"/auth/realms/dwt-group/protocol/openid-connect/token",
-            "headers": {
-                'Content-Type': 'application/x-www-form-urlencoded',
-            },
+            "url": _DABSSO_BASE / 'auth/realms/dwt-group/protocol/openid-connect/token',
+            "headers": dict(_FORM_HEADERS),
             "data": {
                 'client_id': openid_client_id,
                 'client_secret': openid_client_secret,
@@ -572,23 +653,15 @@ class DabPumpsApi:
             },
         }
         
-        _LOGGER.debug(f"Try login with DConnect (app); authenticate '{self._username}' via {request["method"]} {request["url"]}")
+        _LOGGER.debug("Try login with DConnect (app); authenticate '%s' via %s %s", self._username, request["method"], request["url"])
         result = await self._async_send_request(context, request)
 
-        self._access_token = self._validate_token( result.get('access_token') )
-        self._access_expires_in = self._validate_expires_in( result.get('expires_in'), DCONNECT_ACCESS_TOKEN_VALID )
-        self._access_expiry = self._calculate_expiry(self._access_expires_in)
-
-        self._refresh_token = self._validate_token( result.get('refresh_token') )    # expected to be empty
-        self._refresh_expires_in = self._validate_expires_in( result.get('refresh_expires_in'), DCONNECT_REFRESH_TOKEN_VALID)
-        self._refresh_expiry = self._calculate_expiry(self._refresh_expires_in)
-        self._refresh_client_id = openid_client_id
-        self._refresh_client_secret = openid_client_secret
-
-        if not self._access_token:
-            error = f"No tokens found in response from {request["url"]}"
-            _LOGGER.debug(error)    # logged as warning after last retry
-            raise DabPumpsApiAuthError(error)
+        # Note: the refresh token is expected to be empty for this method
+        self._store_tokens(result, request["url"],
+            access_token_valid = DCONNECT_ACCESS_TOKEN_VALID,
+            refresh_token_valid = DCONNECT_REFRESH_TOKEN_VALID,
+            client_id = openid_client_id,
+            client_secret = openid_client_secret)
 
         # if we reach this point then the token was OK
         self._login_time = datetime.now()
@@ -597,7 +670,7 @@ class DabPumpsApi:
         self._auth_method = DabPumpsAuth.HEADER
         self._extra_headers = { "User-Agent": DCONNECT_APP_USER_AGENT }
         
-        _LOGGER.debug(f"Login succeeded using method {self._login_method}")
+        _LOGGER.debug("Login succeeded using method %s", self._login_method)
         return True
 
 
@@ -611,10 +684,10 @@ class DabPumpsApi:
             "url": DCONNECT_API_URL,
         }
 
-        _LOGGER.debug(f"Try login with DConnect (web); retrieve login page via {request["method"]} {request["url"]}")
+        _LOGGER.debug("Try login with DConnect (web); retrieve login page via %s %s", request["method"], request["url"])
         text = await self._async_send_request(context, request)
         
-        match = re.search(r'action\s?=\s?\"(.*?)\"', text, re.MULTILINE)
+        match = _ACTION_URL_RE.search(text)
         if not match:    
             error = f"Unexpected response while retrieving login url from {request["url"]}: {text}"
             _LOGGER.debug(error)    # logged as warning after last retry
@@ -625,16 +698,14 @@ class DabPumpsApi:
         request = {
             "method": "POST",
             "url": match.group(1).replace('&amp;', '&'),
-            "headers": {
-                'Content-Type': 'application/x-www-form-urlencoded',
-            },
+            "headers": dict(_FORM_HEADERS),
             "data": {
                 'username': self._username, 
                 'password': self._password 
             },
         }
         
-        _LOGGER.debug(f"Try login with DConnect (web); authenticate '{self._username}' via {request["method"]} {request["url"]}")
+        _LOGGER.debug("Try login with DConnect (web); authenticate '%s' via %s %s", self._username, request["method"], request["url"])
         await self._async_send_request(context, request)
 
         # Verify the client access_token cookie has been set
@@ -664,10 +735,32 @@ class DabPumpsApi:
         self._auth_method = DabPumpsAuth.COOKIE
         self._extra_headers = {}
 
-        _LOGGER.debug(f"Login succeeded using method {self._login_method}")
+        _LOGGER.debug("Login succeeded using method %s", self._login_method)
         return True
 
-        
+
+    def _store_tokens(self, result: dict, url, access_token_valid: int, refresh_token_valid: int,
+                      client_id: str|None = None, client_secret: str|None = None, require_refresh: bool = False):
+        """
+        Validate and store the access and refresh tokens from a token response.
+        Shared by the login methods that authenticate via Authorization header.
+        """
+        self._access_token = self._validate_token( result.get('access_token') )
+        self._access_expires_in = self._validate_expires_in( result.get('expires_in'), access_token_valid )
+        self._access_expiry = self._calculate_expiry(self._access_expires_in)
+
+        self._refresh_token = self._validate_token( result.get('refresh_token') )
+        self._refresh_expires_in = self._validate_expires_in( result.get('refresh_expires_in'), refresh_token_valid)
+        self._refresh_expiry = self._calculate_expiry(self._refresh_expires_in)
+        self._refresh_client_id = client_id
+        self._refresh_client_secret = client_secret
+
+        if not self._access_token or (require_refresh and not self._refresh_token):
+            error = f"No tokens found in response from {url}"
+            _LOGGER.debug(error)    # logged as warning after last retry
+            raise DabPumpsApiAuthError(error)
+
+
     async def async_logout(self):
         """Logout from DAB Pumps"""
 
@@ -686,7 +779,7 @@ class DabPumpsApi:
 
         # Reduce amount of tracing to only when we are actually logged-in.
         if self._login_time and method not in [DabPumpsLogin.ACCESS_TOKEN]:
-            _LOGGER.debug(f"Logout")
+            _LOGGER.debug("Logout")
 
         # Home Assistant will issue a warning when calling aclose() on the async aiohttp client.
         # Instead of closing we will simply forget all cookies. The result is that on a next
@@ -714,12 +807,21 @@ class DabPumpsApi:
 
 
     def _validate_token(self, token: str|None) -> str:
+        # Tokens can re-appear unchanged on refresh cycles; remember the ones that
+        # already passed the decode check and skip the repeated base64+json work
+        if token in self._validated_tokens:
+            return token
+
         try:
             jwt.decode(jwt=token, options={"verify_signature": False})
-            return token
-        except:            
+        except:
             return ""
 
+        if len(self._validated_tokens) > 16:
+            self._validated_tokens.clear()
+        self._validated_tokens.add(token)
+        return token
+
 
     def _validate_expires_in(self, expires_in: int|None, default: int) -> int:
         if expires_in:
@@ -738,6 +840,49 @@ class DabPumpsApi:
         return datetime.now() + timedelta(seconds=expires_in) - timedelta(seconds=margin)
 
 
+    async def async_refresh_all(self, install_id: str|None = None, lang: str|None = None):
+        """
+        Login and refresh all data in one call.
+        This fills:
+          string_map     (when lang is given)
+          install_map    (details for each install)
+          device_map     (details for each device)
+          config_map     (config metadata for each device)
+          status_map     (statuses for each device)
+
+        Independent fetches are gathered so their round-trips overlap.
+        """
+        await self.async_login()
+
+        # String translations and installation list only depend on the login
+        coros = [ self.async_fetch_install_list() ]
+        if lang:
+            coros.append( self.async_fetch_strings(lang) )
+        await asyncio.gather(*coros)
+
+        # Then fetch details for one or all installations
+        if install_id:
+            await self.async_fetch_install_details(install_id)
+        else:
+            await self.async_fetch_all_install_details()
+
+
+    async def async_fetch_all_install_details(self):
+        """
+        Fetch the details for all installations in install_map in parallel.
+        Concurrency towards the servers is capped by the request semaphore.
+        """
+        await asyncio.gather( *(self.async_fetch_install_details(i) for i in self._install_map) )
+
+
+    async def async_fetch_all_install_statuses(self):
+        """
+        Fetch the statuses for all installations in install_map in parallel.
+        Concurrency towards the servers is capped by the request semaphore.
+        """
+        await asyncio.gather( *(self.async_fetch_install_statuses(i) for i in self._install_map) )
+
+
     async def async_fetch_install_list(self):
         """
         Get installation list
@@ -747,8 +892,8 @@ class DabPumpsApi:
 
         # Retrieve data via REST request
         match self._fetch_method:
-            case DabPumpsFetch.DABCS:    url = DABCS_API_URL + '/mobile/v1/installations'
-            case DabPumpsFetch.DCONNECT: url = DCONNECT_API_URL + '/api/v1/installation' # or DABPUMPS_API_URL + '/getInstallationList'
+            case DabPumpsFetch.DABCS:    url = _DABCS_BASE / 'mobile/v1/installations'
+            case DabPumpsFetch.DCONNECT: url = _DCONNECT_BASE / 'api/v1/installation' # or DABPUMPS_API_URL + '/getInstallationList'
 
         context = f"installations {self._username.lower()}"
         request = {
@@ -756,7 +901,7 @@ class DabPumpsApi:
             "url": url,
         }
 
-        _LOGGER.debug(f"Retrieve installation list for '{self._username}' via {request["method"]} {request["url"]}")
+        _LOGGER.debug("Retrieve installation list for '%s' via %s %s", self._username, request["method"], request["url"])
         raw = await self._async_send_request(context, request)  
 
         # Process the resulting raw data
@@ -773,23 +918,23 @@ class DabPumpsApi:
         #   ]
         # }
         install_map = {}
-        installations = raw.get('installations', None) or raw.get('values', None) or raw.get('rows', None) or []
+        installations = raw.get('installations') or raw.get('values') or raw.get('rows') or ()
         
         for install_idx, installation in enumerate(installations):
             
             install_id = installation.get('installation_id', '')
-            install_name = installation.get('name', None) or installation.get('description', None) or f"installation {install_idx}"
+            install_name = _first(installation, 'name', 'description', default=f"installation {install_idx}")
             install_meta = installation.get('metadata', {})
 
-            _LOGGER.debug(f"Installation found: {install_name}")
+            _LOGGER.debug("Installation found: %s", install_name)
             install = DabPumpsInstall(
                 id = install_id,
                 name = install_name,
-                description = installation.get('description', None) or '',
-                company = installation.get('company', None) or install_meta.get('company', None) or '',
-                address = installation.get('address', None) or install_meta.get('address', None) or '',
-                role = installation.get('current_user_role', None) or installation.get('user_role', None) or DabPumpsUserRole.CUSTOMER,
-                devices = len(installation.get('dums', None) or []),
+                description = installation.get('description') or '',
+                company = installation.get('company') or install_meta.get('company') or '',
+                address = installation.get('address') or install_meta.get('address') or '',
+                role = _first(installation, 'current_user_role', 'user_role', default=DabPumpsUserRole.CUSTOMER),
+                devices = len(installation.get('dums') or ()),
             )
             install_map[install_id] = install
 
@@ -814,19 +959,26 @@ class DabPumpsApi:
         # Retrieve list of devices within this install
         raw = await self._async_fetch_install_devices(install_id)
 
-        # First retrieve all device configs
-        for config_id in [ d.config_id for d in self._device_map.values() if d.install_id==install_id ]:
-            await self._async_fetch_device_config(config_id, raw_install_data=raw)
+        # Filter the device_map once; both loops below use the same selection
+        install_devices = [ d for d in self._device_map.values() if d.install_id==install_id ]
+
+        # First retrieve all device configs.
+        # Devices of the same type share a config; a set keeps each config_id
+        # to a single fetch instead of one per device, and independent configs
+        # are fetched in parallel.
+        await asyncio.gather( *(self._async_fetch_device_config(config_id, raw_install_data=raw)
+                                for config_id in { d.config_id for d in install_devices }) )
 
-        # Next, generate static statuses from the device configs
-        # and retrieve inital device statuses
-        for serial in [ d.serial for d in self._device_map.values() if d.install_id==install_id ]:
+        # Next, generate static statuses from the device configs, retrieve inital
+        # device statuses and derive extra device details. The steps stay ordered
+        # per device, but independent devices are processed in parallel.
+        async def _process_device(serial: str):
             await self._async_fetch_static_statuses(serial)
             await self._async_fetch_device_statuses(serial, raw_install_data=raw)
-
-            # Finally, derive extra device details
             await self._async_derive_device_details(serial)
 
+        await asyncio.gather( *(_process_device(d.serial) for d in install_devices) )
+
 
     async def async_fetch_install_statuses(self, install_id: str):
         """
@@ -839,17 +991,20 @@ class DabPumpsApi:
             case DabPumpsFetch.DABCS:
                 # Returns statuses for all devices in one call
                 context = f"statuses {install_id}"
-                request = { "method": "GET", "url": DABCS_API_URL + f"/mobile/v1/installations/{install_id}/dums" }
+                request = { "method": "GET", "url": _DABCS_BASE / 'mobile/v1/installations' / install_id / 'dums' }
         
-                _LOGGER.debug(f"Retrieve installation statuses via {request["method"]} {request["url"]}")
+                _LOGGER.debug("Retrieve installation statuses via %s %s", request["method"], request["url"])
                 raw = await self._async_send_request(context, request)
 
             case DabPumpsFetch.DCONNECT:
                 # Needs to retrieve data per device
                 raw = None
 
-        for serial in [ d.serial for d in self._device_map.values() if d.install_id==install_id ]:
-            await self._async_fetch_device_statuses(serial, raw_install_data=raw)
+        # Process all devices in parallel. For DConnect this overlaps the per-device
+        # requests (bounded by the request semaphore); for DabCS the shared raw data
+        # is simply split per device.
+        serials = [ d.serial for d in self._device_map.values() if d.install_id==install_id ]
+        await asyncio.gather( *(self._async_fetch_device_statuses(serial, raw_install_data=raw) for serial in serials) )
         
         
     async def _async_fetch_install_devices(self, install_id: str):
@@ -857,8 +1012,8 @@ class DabPumpsApi:
 
         # Retrieve data via REST request
         match self._fetch_method:
-            case DabPumpsFetch.DABCS:    url = DABCS_API_URL + f"/mobile/v1/installations/{install_id}/dums?include_configuration=true"
-            case DabPumpsFetch.DCONNECT: url = DCONNECT_API_URL + f"/api/v1/installation/{install_id}" # or DABPUMPS_API_URL + f"/getInstallation/{install_id}"
+            case DabPumpsFetch.DABCS:    url = (_DABCS_BASE / 'mobile/v1/installations' / install_id / 'dums').with_query(include_configuration='true')
+            case DabPumpsFetch.DCONNECT: url = _DCONNECT_BASE / 'api/v1/installation' / install_id # or DABPUMPS_API_URL + f"/getInstallation/{install_id}"
 
         context = f"installation {install_id}"
         request = {
@@ -866,7 +1021,7 @@ class DabPumpsApi:
             "url": url,
         }
         
-        _LOGGER.debug(f"Retrieve installation details via {request["method"]} {request["url"]}")
+        _LOGGER.debug("Retrieve installation details via %s %s", request["method"], request["url"])
         raw = await self._async_send_request(context, request)
 
         # Process the resulting raw data
@@ -890,11 +1045,11 @@ class DabPumpsApi:
         ins_dums = raw.get('dums', [])
 
         for dum_idx, dum in enumerate(ins_dums):
-            dum_serial = dum.get('serial', None) or ''
-            dum_name = dum.get('name', None) or dum.get('ProductName', None) or f"device {dum_idx}"
-            dum_product = dum.get('ProductName', None) or dum.get('distro_embedded', None) or f"device {dum_idx}"
-            dum_version = dum.get('configuration_name', None) or dum.get('distro_embedded', None) or ''
-            dum_config = dum.get('configuration_id', None) or ''
+            dum_serial = dum.get('serial') or ''
+            dum_name = _first(dum, 'name', 'ProductName', default=f"device {dum_idx}")
+            dum_product = _first(dum, 'ProductName', 'distro_embedded', default=f"device {dum_idx}")
+            dum_version = _first(dum, 'configuration_name', 'distro_embedded')
+            dum_config = dum.get('configuration_id') or ''
 
             if not dum_serial: 
                 raise DabPumpsApiDataError(f"Could not find installation attribute 'serial'")
@@ -916,7 +1071,7 @@ class DabPumpsApi:
             )
             device_map[dum_serial] = device
             
-            _LOGGER.debug(f"Device found: {dum_name} with serial {dum_serial}")
+            _LOGGER.debug("Device found: %s with serial %s", dum_name, dum_serial)
             
         # Sanity check. # Never overwrite a known device_map
         if len(device_map) == 0:
@@ -934,9 +1089,23 @@ class DabPumpsApi:
         return raw
 
 
+    def invalidate_config(self, config_id: str):
+        """Force the next fetch of this device config to bypass the cache"""
+        self._config_fetch_ts.pop(config_id, None)
+
+
     async def _async_fetch_device_config(self, config_id: str, raw_install_data: dict|None = None):
         """Fetch the statuses for a DAB Pumps device, which then constitues the Sensors"""
 
+        # Device configs are immutable in practice and multiple devices in one install
+        # commonly share the same config_id. Skip the fetch when a recent copy is cached.
+        config_ts = self._config_fetch_ts.get(config_id)
+        if config_ts and config_id in self._config_map and \
+           (datetime.now() - config_ts).total_seconds() < CONFIG_CACHE_VALID:
+
+            _LOGGER.debug("Reuse cached device config for '%s'", config_id)
+            return
+
         # Retrieve data via REST request
         conf = {}
         conf_id = None
@@ -967,9 +1136,9 @@ class DabPumpsApi:
                 raw_install_data = None
 
                 context = f"configuration {config_id}"
-                request = { "method": "GET", "url":  DCONNECT_API_URL + f"/api/v1/configuration/{config_id}" }
+                request = { "method": "GET", "url": _DCONNECT_BASE / 'api/v1/configuration' / config_id }
         
-                _LOGGER.debug(f"Retrieve device config for '{config_id}' via {request["method"]} {request["url"]}")
+                _LOGGER.debug("Retrieve device config for '%s' via %s %s", config_id, request["method"], request["url"])
                 raw = await self._async_send_request(context, request)
 
                 # {
@@ -979,19 +1148,17 @@ class DabPumpsApi:
                 conf_id = None
 
         # Process the resulting raw data
-        config_map = {}
-
         conf_id = conf_id or conf.get('configuration_id', '')
-        conf_name = conf.get('name') or conf.get('ProductName') or f"config {conf_id}"
-        conf_label = conf.get('label') or conf.get('family') or f"config {conf_id}"
-        conf_descr = conf.get('description') or conf.get('ProductName') or f"config {conf_id}"
+        conf_name = _first(conf, 'name', 'ProductName', default=f"config {conf_id}")
+        conf_label = _first(conf, 'label', 'family', default=f"config {conf_id}")
+        conf_descr = _first(conf, 'description', 'ProductName', default=f"config {conf_id}")
         conf_params = {}
 
         if conf_id != config_id: 
             raise DabPumpsApiDataError(f"Expected configuration id {config_id} was not found in returned configuration data")
             
         meta = conf.get('metadata') or {}
-        meta_params = meta.get('params') or conf.get('params') or []
+        meta_params = meta.get('params') or conf.get('params') or ()
         
         for meta_param_idx, meta_param in enumerate(meta_params):
             # get param details
@@ -1004,8 +1171,9 @@ class DabPumpsApi:
             param_family = meta_param.get('family') or ''
             param_group = meta_param.get('group') or ''
             
-            values = meta_param.get('values') or []
-            param_values = { str(v[0]): str(v[1]) for v in values if len(v) >= 2 }
+            values = meta_param.get('values') or ()
+            # dict() over a 2-tuple generator inserts at C level; avoids the comprehension frame
+            param_values = dict( (str(v[0]), str(v[1])) for v in values if len(v) >= 2 )
             
             param = DabPumpsParams(
                 key = param_name,
@@ -1018,10 +1186,10 @@ class DabPumpsApi:
                 max = param_max,
                 family = param_family,
                 group = param_group,
-                view = ''.join([ s[0] for s in (meta_param.get('view') or []) ]),
-                change = ''.join([ s[0] for s in (meta_param.get('change') or []) ]),
-                log = ''.join([ s[0] for s in (meta_param.get('log') or []) ]),
-                report = ''.join([ s[0] for s in (meta_param.get('report') or []) ])
+                view = _first_chars(meta_param.get('view')),
+                change = _first_chars(meta_param.get('change')),
+                log = _first_chars(meta_param.get('log')),
+                report = _first_chars(meta_param.get('report'))
             )
             conf_params[param_name] = param
         
@@ -1031,16 +1199,13 @@ class DabPumpsApi:
             description = conf_descr,
             meta_params = conf_params
         )
-        config_map[conf_id] = config
-        
-        if len(config_map) == 0:
-            raise DabPumpsApiDataError(f"No config found for '{config_id}'")
-        
-        _LOGGER.debug(f"Configuration found: {conf_name} with {len(conf_params)} metadata params")        
+        _LOGGER.debug("Configuration found: %s with %s metadata params", conf_name, len(conf_params))
 
-        # Merge with configurations from other devices
+        # Merge with configurations from other devices; a single config is built
+        # per call, so assign it directly instead of going through a one-entry dict
         self._config_map_ts = datetime.now()
-        self._config_map.update(config_map)
+        self._config_map[conf_id] = config
+        self._config_fetch_ts[conf_id] = self._config_map_ts
         
 
     async def _async_fetch_static_statuses(self, serial: str):
@@ -1069,7 +1234,7 @@ class DabPumpsApi:
                 value = None
 
             # Detect 'button' params (type 'enum' with only one possible value)
-            if params.type == DabPumpsParamType.ENUM and len(params.values or []) == 1:
+            if params.type == DabPumpsParamType.ENUM and len(params.values or ()) == 1:
                 is_static = True
                 code = str(params.min) if params.min is not None else "0"
                 value = ""
@@ -1078,14 +1243,16 @@ class DabPumpsApi:
             pass
 
             if is_static:
+                # Intern the low-cardinality string fields; they repeat across
+                # devices and polls, so duplicates collapse to one shared object
                 status_key = DabPumpsApi.create_id(device.serial, params.key)
                 status_new = DabPumpsStatus(
-                    serial = device.serial,
-                    key = params.key,
+                    serial = sys.intern(device.serial),
+                    key = sys.intern(params.key),
                     name = self._translate_string(params.key),
-                    code = code,
+                    code = sys.intern(code) if type(code) is str else code,
                     value = value,
-                    unit = params.unit,
+                    unit = sys.intern(params.unit) if type(params.unit) is str else params.unit,
                     status_ts = datetime.now(timezone.utc),
                     update_ts = None,
                 )
@@ -1093,7 +1260,8 @@ class DabPumpsApi:
 
         # Merge with statuses from other devices
         self._status_static_map_ts = datetime.now()
-        self._status_static_map.update(status_map)
+        self._status_static_map |= status_map
+        self._status_keys_by_serial.setdefault(serial, set()).update(status_map)
         
         
     async def _async_fetch_device_statuses(self, serial: str, raw_install_data: dict|None = None):
@@ -1116,7 +1284,7 @@ class DabPumpsApi:
                 ins_dums = raw_install_data.get('dums', [])
             
                 for dum in ins_dums:
-                    dum_serial = dum.get('serial', None) or ''
+                    dum_serial = dum.get('serial') or ''
                     if dum_serial == serial:
                         statusts = dum.get('statusts') or ""
                         values = dum.get('status') or {}
@@ -1126,9 +1294,9 @@ class DabPumpsApi:
                 # Raw install data does not contain statuses when using this method.
                 # Retrieve statuses specific for this device
                 context = f"statuses {serial}"
-                request = { "method": "GET", "url": DCONNECT_API_URL + f"/dumstate/{serial}" } # or f"/api/v1/dum/{serial}/state"
+                request = { "method": "GET", "url": _DCONNECT_BASE / 'dumstate' / serial } # or f"/api/v1/dum/{serial}/state"
                 
-                _LOGGER.debug(f"Retrieve device statuses for '{serial}' via {request["method"]} {request["url"]}")
+                _LOGGER.debug("Retrieve device statuses for '%s' via %s %s", serial, request["method"], request["url"])
                 raw = await self._async_send_request(context, request)
                 
                 # {
@@ -1138,30 +1306,39 @@ class DabPumpsApi:
                 # }
                 statusts = raw.get('statusts') or ""
                 status = raw.get('status') or "{}" # string!
-                values = json.loads(status)
+                values = _json_loads(status)
 
         # Process the resulting raw data
+        # Take the wall-clock once; one timestamp is accurate enough for a whole batch
+        # and saves a syscall + object allocation per status
         status_map = {}
-        status_ts = datetime.fromisoformat(statusts) if statusts else datetime.now(timezone.utc)
+        now_utc = datetime.now(timezone.utc)
+        status_ts = datetime.fromisoformat(statusts) if statusts else now_utc
+
+        # Hoist the repeated attribute/method lookups out of the loop; with 100+
+        # statuses per device these resolve once instead of once per status
+        create_id = DabPumpsApi.create_id
+        actual_get = self._status_actual_map.get
+        serial_interned = sys.intern(serial)
 
         for item_key, item_code in values.items():
             try:
                 # the code 'h' is used when a property is not available/supported
-                # Note the some properties (PowerShowerCountdown, SleepModeCountdown) can switch between 
+                # Note the some properties (PowerShowerCountdown, SleepModeCountdown) can switch between
                 # availabe (and be in _status_actual_map) and unavailable (still be in _status_static_map).
                 if item_code=='h':
                     continue
 
                 # Check if this status was recently updated via async_change_device_status
-                # We keep the updated value for a hold period to prevent it from flipping back and forth 
+                # We keep the updated value for a hold period to prevent it from flipping back and forth
                 # between its old value and new value because of delays in update on the DAB server side.
-                status_key = DabPumpsApi.create_id(serial, item_key)
-                status_old = self._status_actual_map.get(status_key, None)
+                status_key = create_id(serial, item_key)
+                status_old = actual_get(status_key)
 
                 if status_old and status_old.update_ts is not None and \
-                (datetime.now(timezone.utc) - status_old.update_ts).total_seconds() < STATUS_UPDATE_HOLD:
+                (now_utc - status_old.update_ts).total_seconds() < STATUS_UPDATE_HOLD:
 
-                    _LOGGER.info(f"Skip refresh of recently updated status ({status_key})")
+                    _LOGGER.info("Skip refresh of recently updated status (%s)", status_key)
                     status_map[status_key] = status_old
                     continue
 
@@ -1169,13 +1346,15 @@ class DabPumpsApi:
                 (item_val, item_unit) = self._decode_status_value(serial, item_key, item_code)
 
                 # Add it to our statuses
+                # Intern the low-cardinality string fields; they repeat across
+                # devices and polls, so duplicates collapse to one shared object
                 status_new = DabPumpsStatus(
-                    serial = serial,
-                    key = item_key,
+                    serial = serial_interned,
+                    key = sys.intern(item_key),
                     name = self._translate_string(item_key),
-                    code = item_code,
+                    code = sys.intern(item_code) if type(item_code) is str else item_code,
                     value = item_val,
-                    unit = item_unit,
+                    unit = sys.intern(item_unit) if type(item_unit) is str else item_unit,
                     status_ts = status_ts,
                     update_ts = None,
                 )
@@ -1187,28 +1366,33 @@ class DabPumpsApi:
         if len(status_map) == 0:
             raise DabPumpsApiDataError(f"No statuses found for '{serial}'")
         
-        _LOGGER.debug(f"Statuses found for '{serial}' with {len(status_map)} values")
+        _LOGGER.debug("Statuses found for '%s' with %s values", serial, len(status_map))
 
         # Merge with statuses from other devices
         self._status_actual_map_ts = datetime.now()
-        self._status_actual_map.update(status_map)
+        self._status_actual_map |= status_map
+        self._status_keys_by_serial.setdefault(serial, set()).update(status_map)
 
         # Cleanup statuses from this device that are no longer needed in _status_actual_map
-        candidate_map = { k:v for k,v in self._status_actual_map.items() if v.serial == serial and not k in status_map }
+        # Collected as a list of pairs; building an intermediate dict would mean an
+        # extra allocation plus a rehash per entry
+        candidates = [ (k,v) for k,v in self._status_actual_map.items() if v.serial == serial and not k in status_map ]
 
-        for status_key, status_old in candidate_map.items():
+        for status_key, status_old in candidates:
                 
             # Check if this status was recently updated via async_change_device_status
             # We keep the updated value for a hold period to prevent it from flipping back and forth 
             # between its old value and new value because of delays in update on the DAB server side.
             if status_old.update_ts is not None and \
-               (datetime.now(timezone.utc) - status_old.update_ts).total_seconds() < STATUS_UPDATE_HOLD:
+               (now_utc - status_old.update_ts).total_seconds() < STATUS_UPDATE_HOLD:
 
                 # Recently updated static status (i.e. button press)
                 continue
                 
             # Status can be removed
             self._status_actual_map.pop(status_key, None)
+            if status_key not in self._status_static_map:
+                self._status_keys_by_serial.get(serial, set()).discard(status_key)
         
         
     async def _async_derive_device_details(self, serial: str):
@@ -1224,13 +1408,14 @@ class DabPumpsApi:
         for attr,keys in DEVICE_ATTR_EXTRA.items():
             for key in keys:
 
-                # Try to find a status for this key and device
-                status = next( (status for status in self._status_actual_map.values() if status.serial==serial and status.key==key), None)
+                # Try to find a status for this key and device; hashed lookup on
+                # the status maps instead of a scan over all statuses
+                status = self.get_status_value(serial, key)
                 
                 if status is not None and status.value is not None:
                     # Found it. Update the device attribute (workaround via dict because it is a namedtuple)
                     if getattr(device, attr) != status.value:
-                        _LOGGER.debug(f"Found extra device attribute {serial} {attr} = {status.value}")
+                        _LOGGER.debug("Found extra device attribute %s %s = %s", serial, attr, status.value)
                         setattr(device, attr, status.value)
 
         self._device_detail_ts = datetime.now()
@@ -1267,32 +1452,39 @@ class DabPumpsApi:
             # Not changed
             return False
         
-        _LOGGER.info(f"Set {serial}:{key} from {status.value} to {value} ({code})")
+        _LOGGER.info("Set %s:%s from %s to %s (%s)", serial, key, status.value, value, code)
         
-        # update the cached value in status_map
-        status_upd = replace(status, code = code, value = value, update_ts = datetime.now(timezone.utc))
-        self._status_actual_map[status_key] = status_upd
+        # Update the cached value in status_map.
+        # A status already in the actual map is mutated in place instead of copied;
+        # a status that only exists as a static template is copied first, so the
+        # template keeps its empty value.
+        if self._status_actual_map.get(status_key) is status:
+            status.code = code
+            status.value = value
+            status.update_ts = datetime.now(timezone.utc)
+            status_upd = status
+        else:
+            status_upd = replace(status, code = code, value = value, update_ts = datetime.now(timezone.utc))
+            self._status_actual_map[status_key] = status_upd
         
         # Update data via REST request
         context = f"set {status_upd.serial}:{status_upd.key}"
 
         match self._fetch_method:
-            case DabPumpsFetch.DABCS: url = DABCS_API_URL + f"/mobile/v1/dums/{status_upd.serial}/setparam?skipLogging=false"
-            case DabPumpsFetch.DCONNECT: url = DCONNECT_API_URL + f"/dum/{status_upd.serial}"
+            case DabPumpsFetch.DABCS: url = (_DABCS_BASE / 'mobile/v1/dums' / status_upd.serial / 'setparam').with_query(skipLogging='false')
+            case DabPumpsFetch.DCONNECT: url = _DCONNECT_BASE / 'dum' / status_upd.serial
         
         request = {
             "method": "POST",
             "url": url,
-            "headers": {
-                'Content-Type': 'application/json',
-            },
+            "headers": dict(_JSON_HEADERS),
             "json": {
                 'key': status_upd.key, 
                 'value': status_upd.code
             },
         }
         
-        _LOGGER.debug(f"Set device param for '{status.serial}:{status.key}' to '{value}' via {request["method"]} {request["url"]}")
+        _LOGGER.debug("Set device param for '%s:%s' to '%s' via %s %s", status.serial, status.key, value, request["method"], request["url"])
         raw = await self._async_send_request(context, request)
         
         # If no exception was thrown then the operation was successfull
@@ -1310,20 +1502,20 @@ class DabPumpsApi:
                 context = f"del {install_id}:{self._username}"
                 request = {
                     "method": "DELETE",
-                    "url": DABCS_API_URL + f"/mobile/v1/installations/{install_id}/users/{role_old}/{self._username}",
+                    "url": _DABCS_BASE / 'mobile/v1/installations' / install_id / 'users' / role_old / self._username,
                 }
-                _LOGGER.debug(f"Del install role via {request["method"]} {request["url"]}")
+                _LOGGER.debug("Del install role via %s %s", request["method"], request["url"])
                 raw = await self._async_send_request(context, request)
 
                 context = f"add {install_id}:{self._username}"
                 request = {
                     "method": "POST",
-                    "url": DABCS_API_URL + f"/mobile/v1/installations/{install_id}/users/{role_new}/{self._username}",
+                    "url": _DABCS_BASE / 'mobile/v1/installations' / install_id / 'users' / role_new / self._username,
                     "headers": {
                       'Content-Length': '0',
                     },
                 }
-                _LOGGER.debug(f"Add install role via {request["method"]} {request["url"]}")
+                _LOGGER.debug("Add install role via %s %s", request["method"], request["url"])
                 raw = await self._async_send_request(context, request)
 
             case DabPumpsFetch.DCONNECT: 
@@ -1331,9 +1523,9 @@ class DabPumpsApi:
                 context = f"user {self._username}"
                 request = {
                     "method": "GET",
-                    "url": DCONNECT_API_URL + f"/api/v1/user", # or DCONNECT_API_URL + f"/user/{username}/search"
+                    "url": _DCONNECT_BASE / 'api/v1/user', # or DCONNECT_API_URL + f"/user/{username}/search"
                 }
-                _LOGGER.debug(f"Get user via {request["method"]} {request["url"]}")
+                _LOGGER.debug("Get user via %s %s", request["method"], request["url"])
                 raw = await self._async_send_request(context, request)
 
                 user_id = raw.get('user_id') or ""
@@ -1342,17 +1534,17 @@ class DabPumpsApi:
                 context = f"del {install_id}:{self._username}"
                 request = {
                     "method": "GET",
-                    "url": DCONNECT_API_URL + f"/installation/{install_id}/remove/{role_old}/{user_id}",
+                    "url": _DCONNECT_BASE / 'installation' / install_id / 'remove' / role_old / user_id,
                 }
-                _LOGGER.debug(f"Del install role via {request["method"]} {request["url"]}")
+                _LOGGER.debug("Del install role via %s %s", request["method"], request["url"])
                 raw = await self._async_send_request(context, request)
 
                 context = f"add {install_id}:{self._username}"
                 request = {
                     "method": "GET",
-                    "url": DCONNECT_API_URL + f"/installation/{install_id}/add/{role_new}/{user_id}",
+                    "url": _DCONNECT_BASE / 'installation' / install_id / 'add' / role_new / user_id,
                 }
-                _LOGGER.debug(f"Add install role via {request["method"]} {request["url"]}")
+                _LOGGER.debug("Add install role via %s %s", request["method"], request["url"])
                 raw = await self._async_send_request(context, request)
         
         # If no exception was thrown then the operation was successfull
@@ -1366,10 +1558,10 @@ class DabPumpsApi:
         context = f"localization_{lang}"
         request = {
             "method": "GET",
-            "url": DCONNECT_API_URL + f"/resources/js/localization_{lang}.properties?format=JSON&fullmerge=1",
+            "url": _TRANSLATIONS_URL_PREFIX + lang + _TRANSLATIONS_URL_SUFFIX,
         }
         
-        _LOGGER.debug(f"Retrieve language info via {request["method"]} {request["url"]}")
+        _LOGGER.debug("Retrieve language info via %s %s", request["method"], request["url"])
         raw = await self._async_send_request(context, request)
 
         # Process the resulting raw data
@@ -1383,13 +1575,14 @@ class DabPumpsApi:
         # }
         language = raw.get('bundle', '')
         messages = raw.get('messages', {})
-        string_map = { k: v for k, v in messages.items() }
+        # The parsed messages dict is not retained elsewhere, so no need to copy it
+        string_map = messages if isinstance(messages, dict) else {}
         
         # Sanity check. # Never overwrite a known string_map with empty lists
         if len(string_map) == 0:
             raise DabPumpsApiDataError(f"No strings found in data")
 
-        _LOGGER.debug(f"Strings found: {len(string_map)} in language '{language}'")
+        _LOGGER.debug("Strings found: %s in language '%s'", len(string_map), language)
         
         # Remember this data
         self._string_map_ts = datetime.now() if len(string_map) > 0 else datetime.min
@@ -1407,6 +1600,19 @@ class DabPumpsApi:
         return self._status_actual_map.get(status_key, None) or self._status_static_map.get(status_key, None)
 
 
+    def get_status_by_key(self, key: str) -> DabPumpsStatus|None:
+        """
+        Resolve a status by its key alone, searching across all known devices.
+        Uses the per-serial key index and hashed lookups instead of scanning
+        the whole status_map.
+        """
+        for serial in self._status_keys_by_serial:
+            status = self.get_status_value(serial, key)
+            if status is not None:
+                return status
+        return None
+
+
     def get_status_metadata(self, serial: str, key: str, translate:bool = True) -> DabPumpsParams:
         """
         Resolve meta params for a status
@@ -1528,24 +1734,67 @@ class DabPumpsApi:
             request["headers"].update(self._extra_headers)
 
         # Add some default headers if not already set via extra_headers
+        # Keep the connection open so the pooled client can reuse it for the next
+        # request, and accept compressed responses to shrink the bytes on the wire.
         request["headers"].setdefault('User-Agent', 'python-requests/2.20.0')
         request["headers"].setdefault('Cache-Control', 'no-store, no-cache, max-age=0')
-        request["headers"].setdefault('Connection', 'close')
+        request["headers"].setdefault('Connection', 'keep-alive')
+        request["headers"].setdefault('Accept-Encoding', 'gzip, deflate')
+
+        # Conditional GET: when we hold an ETag for this url, let the server answer
+        # with '304 Not Modified' and reuse the previously parsed result. Falls back
+        # transparently when the server does not emit ETag headers.
+        # Restricted to data fetches: the cache is keyed by url alone, and login
+        # requests carry one-time query params (state, code_challenge) that must
+        # never be answered with a replay of an earlier response.
+        url = request["url"]
+        use_etag = request["method"] == "GET" and "params" not in request and not context.startswith('login')
+        etag_entry = self._etag_cache.get(url) if use_etag else None
+        if etag_entry:
+            request["headers"].setdefault('If-None-Match', etag_entry[0])
+
+        # Perform the request.
+        # Transient transport errors and server side 5xx responses are retried with
+        # exponential backoff and jitter, so a one-off blip does not invalidate the
+        # session and force the caller to redo the whole login + fetch chain.
+        for attempt in range(REQUEST_RETRY_ATTEMPTS):
+            try:
+                async with self._request_semaphore:
+                    (request,response) = await self._client.async_send_request(request)
+            except Exception as ex:
+                retryable = isinstance(ex, (asyncio.TimeoutError, aiohttp.ClientError, httpx.TransportError))
+                if retryable and attempt < REQUEST_RETRY_ATTEMPTS-1:
+                    backoff = min(30, 2**attempt * (1 + random.random()))
+                    _LOGGER.debug("Transient exception '%s' while trying to reach %s; retry in %.1fs", str(ex), request["url"], backoff)
+                    await asyncio.sleep(backoff)
+                    continue
 
-        # Perform the request
-        try:
-            (request,response) = await self._client.async_send_request(request)
-        except Exception as ex:
-            error = f"Unable to perform request, got exception '{str(ex)}' while trying to reach {request["url"]}"
-            _LOGGER.debug(error)
+                error = f"Unable to perform request, got exception '{str(ex)}' while trying to reach {request["url"]}"
+                _LOGGER.debug(error)
 
-            # Force a logout to so next login will be a real login, not a token reuse
-            await self._async_logout(context)
-            raise DabPumpsApiConnectError(error)
+                # Force a logout to so next login will be a real login, not a token reuse
+                await self._async_logout(context)
+                raise DabPumpsApiConnectError(error)
+
+            # Server side errors (5xx) are usually transient too; client side errors (4xx) are not
+            if not response["success"] and response["status"].startswith("5") and attempt < REQUEST_RETRY_ATTEMPTS-1:
+                backoff = min(30, 2**attempt * (1 + random.random()))
+                _LOGGER.debug("Got response %s from %s; retry in %.1fs", response["status"], request["url"], backoff)
+                await asyncio.sleep(backoff)
+                continue
+
+            break
 
         # Save the diagnostics if requested
         await self._async_update_diagnostics(timestamp, context, request, response)
         
+        # Conditional GET answered with '304 Not Modified'; reuse the cached result.
+        # Checked before the success check below because httpx reports only 2xx
+        # as success, while aiohttp reports all of 2xx and 3xx.
+        if etag_entry and response["status"].startswith("304"):
+            _LOGGER.debug("Reuse cached response for %s (304 Not Modified)", url)
+            return etag_entry[1]
+
         # Check response
         if not response["success"]:
             error = f"Unable to perform request, got response {response["status"]} while trying to reach {request["url"]}"
@@ -1557,23 +1806,21 @@ class DabPumpsApi:
                 raise DabPumpsApiAuthError(error)
             else:
                 raise DabPumpsApiConnectError(error)
-        
+
         if flags.get("redirects",None) == False and response['status'].startswith("302"):
             return response["headers"].get("location", '')
 
-        elif "text" in response:
-            return response["text"]
-        
-        elif "json" in response:
+        result = response.get("text")
+        if result is None:
+            result = response.get("json")
             # if the result structure contains a 'res' value, then check it
-            json = response["json"]
-            res = json.get('res', None)
+            res = result.get('res') if result is not None else None
             if res and res != 'OK':
                 # BAD RESPONSE: { "res": "ERROR", "code": "FORBIDDEN", "msg": "Forbidden operation", "where": "ROUTE RULE" }
-                code = json.get('code', '')
-                msg = json.get('msg', '')
-                
-                if code.upper() in ['FORBIDDEN', 'WRONGCREDENTIAL']:
+                code = result.get('code', '')
+                msg = result.get('msg', '')
+
+                if code.upper() in _AUTH_ERROR_CODES:
                     error = f"Authorization failed: {res} {code} {msg}"
                     _LOGGER.debug(error)
 
@@ -1585,17 +1832,20 @@ class DabPumpsApi:
                     _LOGGER.debug(error)
                     raise DabPumpsApiError(error)
 
-            return json
-        
-        else:
-            return None
-    
+        # Remember the ETag alongside the parsed result for the next conditional GET
+        if use_etag and result is not None:
+            etag = response["headers"].get("ETag")
+            if etag:
+                self._etag_cache[url] = (etag, result)
+
+        return result
+
 
     async def _async_update_diagnostics(self, timestamp: datetime, context: str, request: dict|None, response: dict|None, token: dict|None = None):
 
         if self._diagnostics_callback:
             item = DabPumpsHistoryItem.create(timestamp, context, request, response, token)
-            detail = DabPumpsHistoryDetail.create(timestamp, context, request, response, token)
+            detail = DabPumpsHistoryDetail(ts=timestamp, req=request, rsp=response, token=token)
             data = {
                 "login_time": self._login_time,
                 "login_method": self._login_method,
@@ -8,6 +8,20 @@ from datetime import datetime
 from typing import Any
 from yarl import URL
 
+try:
+    # Optional C accelerated JSON parser; falls back to stdlib when not installed
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+try:
+    # Optional HTTP/2 support for httpx; lets concurrent requests to the same
+    # host multiplex over a single TLS connection instead of one each
+    import h2   # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -55,18 +69,37 @@ class DabPumpsClient_Httpx(DabPumpsClient_Base):
     """
 
     def __init__(self, client:httpx.AsyncClient|None = None):
-        self._asyncclient:httpx.AsyncClient = client or httpx.AsyncClient()
+        self._asyncclient: httpx.AsyncClient|None = client
         self._client_owned = client == None
+        self._closed = False
+
+
+    def _get_asyncclient(self) -> httpx.AsyncClient:
+        # Create our own client on first use, so it is born inside the running
+        # event loop and instances that never perform a request stay cheap.
+        # The client is then kept for the whole life of this instance, so
+        # connections are pooled and TCP+TLS handshakes are paid once per host.
+        if self._asyncclient is None:
+            self._asyncclient = httpx.AsyncClient(
+                http2 = _HTTP2_AVAILABLE,   # negotiated via ALPN; falls back to HTTP/1.1
+                limits = httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                timeout = httpx.Timeout(30, connect=10),
+            )
+        return self._asyncclient
 
 
     @property
     def closed(self) -> bool:
-        return self._asyncclient.is_closed
+        if self._asyncclient is not None:
+            return self._asyncclient.is_closed
+        return self._closed
 
 
     async def async_close(self):
         if self._client_owned:
-            await self._asyncclient.aclose()
+            if self._asyncclient is not None:
+                await self._asyncclient.aclose()
+            self._closed = True
 
 
     async def async_send_request(self, request):
@@ -76,19 +109,20 @@ class DabPumpsClient_Httpx(DabPumpsClient_Base):
         """
         # Perform the httpx request
         timestamp = datetime.now()
+        client = self._get_asyncclient()
 
-        req = self._asyncclient.build_request(
+        req = client.build_request(
             method = request["method"],
-            url = request["url"],
+            url = str(request["url"]),   # httpx does not accept yarl.URL objects
             params = request.get("params", None), 
             data = request.get("data", None),
             json = request.get("json", None),
             headers = request.get("headers", None)
         )
-        rsp = await self._asyncclient.send(req)
+        rsp = await client.send(req)
 
         # Remember actual requests and response params, used for diagnostics
-        _LOGGER.debug(f"rsp: {rsp}")
+        _LOGGER.debug("rsp: %s", rsp)
 
         request["headers"] = req.headers
         response = {
@@ -98,7 +132,7 @@ class DabPumpsClient_Httpx(DabPumpsClient_Base):
             "elapsed": (datetime.now() - timestamp).total_seconds(),
         }
         if rsp.is_success and rsp.headers.get('content-type','').startswith('application/json'):
-            response["json"] = rsp.json()
+            response["json"] = _json_loads(rsp.content)
         else:
             response["text"] = rsp.text
         
@@ -106,15 +140,18 @@ class DabPumpsClient_Httpx(DabPumpsClient_Base):
     
 
     async def async_get_cookie(self, domain:str, name:str):
+        if self._asyncclient is None:
+            return None
         return self._asyncclient.cookies.get(name, domain=domain)
-    
+
 
     async def async_set_cookie(self, domain:str, name:str, value:Any):
-        self._asyncclient.cookies.set(name, value=value, domain=domain, path='/')
-    
-    
+        self._get_asyncclient().cookies.set(name, value=value, domain=domain, path='/')
+
+
     async def async_clear_cookies(self):
-        self._asyncclient.cookies.clear()
+        if self._asyncclient is not None:
+            self._asyncclient.cookies.clear()
 
 
 class DabPumpsClient_Aiohttp(DabPumpsClient_Base):
@@ -123,18 +160,40 @@ class DabPumpsClient_Aiohttp(DabPumpsClient_Base):
     """
 
     def __init__(self, client:aiohttp.ClientSession|None = None):
-        self._clientsession: aiohttp.ClientSession = client or aiohttp.ClientSession()
+        self._clientsession: aiohttp.ClientSession|None = client
         self._client_owned = client == None
+        self._closed = False
+
+
+    def _get_clientsession(self) -> aiohttp.ClientSession:
+        # Create our own session on first use, so it is born inside the running
+        # event loop and instances that never perform a request stay cheap.
+        # The session is then kept for the whole life of this instance, so
+        # connections are pooled and TCP+TLS handshakes are paid once per host.
+        if self._clientsession is None:
+            self._clientsession = aiohttp.ClientSession(
+                connector = aiohttp.TCPConnector(
+                    limit = 100,
+                    limit_per_host = 10,
+                    ttl_dns_cache = 300,        # cache DNS lookups for 5 minutes
+                    keepalive_timeout = 60,     # keep idle connections open between polls
+                ),
+            )
+        return self._clientsession
 
 
     @property
     def closed(self) -> bool:
-        return self._clientsession.closed
+        if self._clientsession is not None:
+            return self._clientsession.closed
+        return self._closed
 
 
     async def async_close(self):
         if self._client_owned:
-            await self._clientsession.close()
+            if self._clientsession is not None:
+                await self._clientsession.close()
+            self._closed = True
 
 
     async def async_send_request(self, request):
@@ -146,7 +205,7 @@ class DabPumpsClient_Aiohttp(DabPumpsClient_Base):
         timestamp = datetime.now()
         flags = request.get("flags", {})
 
-        async with self._clientsession.request(
+        async with self._get_clientsession().request(
             method = request["method"], 
             url = request["url"],
             params = request.get("params", None), 
@@ -165,7 +224,7 @@ class DabPumpsClient_Aiohttp(DabPumpsClient_Base):
                 "elapsed": (datetime.now() - timestamp).total_seconds(),
             }
             if rsp.ok and rsp.headers.get('content-type','').startswith('application/json'):
-                response["json"] = await rsp.json()
+                response["json"] = _json_loads(await rsp.read())
             else:
                 response["text"] = await rsp.text()
             
@@ -173,18 +232,21 @@ class DabPumpsClient_Aiohttp(DabPumpsClient_Base):
         
 
     async def async_get_cookie(self, domain:str, name:str):
+        if self._clientsession is None:
+            return None
         url = URL(f"https://{domain}")
         cookies = self._clientsession.cookie_jar.filter_cookies(url)
         cookie = cookies.get(name, None)
 
         return cookie.value if cookie else None
-    
+
 
     async def async_set_cookie(self, domain:str, key:str, value:Any):
         url = URL(f"https://{domain}")
         val = { key: value }
-        self._clientsession.cookie_jar.update_cookies(val, url)
-    
-    
+        self._get_clientsession().cookie_jar.update_cookies(val, url)
+
+
     async def async_clear_cookies(self):
-        self._clientsession.cookie_jar.clear()
+        if self._clientsession is not None:
+            self._clientsession.cookie_jar.clear()
@@ -1,8 +1,4 @@
 """Constants for the DAB Pumps integration."""
-import logging
-import types
-
-_LOGGER: logging.Logger = logging.getLogger(__package__)
 
 DABSSO_API_URL = "https://dabsso.dabpumps.com"
 
@@ -32,14 +28,29 @@ DCONNECT_APP_USER_AGENT = 'Dalvik/2.1.0 (Linux; U; Android 9; SM-G935F Build/PI)
 # Period to prevent status updates when value was recently updated
 STATUS_UPDATE_HOLD = 30 # seconds
 
+# Period for which a fetched device configuration is considered up to date.
+# Config metadata is immutable in practice, so repeated fetches within this
+# period are answered from the cached config_map without a server round-trip.
+CONFIG_CACHE_VALID = 60*60 # 1 hour in seconds
+
+# Number of attempts for a request before its failure is reported to the caller.
+# Transient transport errors and server side 5xx responses are retried with
+# exponential backoff; client side 4xx responses fail immediately.
+REQUEST_RETRY_ATTEMPTS = 3
+
+# Maximum number of simultaneous requests towards the DAB Pumps servers.
+# Keeps gathered fetches from opening dozens of connections at once and
+# triggering server side throttling.
+MAX_CONCURRENT_REQUESTS = 8
+
 # Extra device attributes that are not in install info, but retrieved from statuses
 DEVICE_ATTR_EXTRA = {
-    "mac_address": ['MacWlan'],
-    "sw_version": ['LvFwVersion', 'ucVersion']
+    "mac_address": ('MacWlan',),
+    "sw_version": ('LvFwVersion', 'ucVersion'),
 }
 
 # Known device statuses that normally don't hold a value until an action occurs
-DEVICE_STATUS_STATIC = {
+DEVICE_STATUS_STATIC = frozenset({
     "PowerShowerCountdown",
     "SleepModeCountdown",
-}
\ No newline at end of file
+})
\ No newline at end of file
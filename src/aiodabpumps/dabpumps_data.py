@@ -1,13 +1,25 @@
 from datetime import datetime
 import logging
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from enum import StrEnum
+from functools import lru_cache
 
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def dataclass_fields(cls) -> tuple:
+    """
+    Cached dataclasses.fields() lookup.
+    dataclasses.fields builds a fresh tuple on every call; the field sets of the
+    classes below are fixed at import time, so one tuple per class can be shared
+    by callers that introspect instances repeatedly.
+    """
+    return fields(cls)
+
+
 class DabPumpsUserRole(StrEnum):
     CUSTOMER = "CUSTOMER"
     INSTALLER = "INSTALLER"
@@ -18,7 +30,7 @@ class DabPumpsParamType(StrEnum):
     LABEL = "label"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DabPumpsInstall:
     id: str
     name: str
@@ -29,7 +41,7 @@ class DabPumpsInstall:
     devices: int
 
 
-@dataclass
+@dataclass(slots=True)
 class DabPumpsDevice:
     id: str
     serial: str
@@ -43,7 +55,7 @@ class DabPumpsDevice:
     install_id: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DabPumpsParams:
     key: str
     name: str
@@ -61,7 +73,7 @@ class DabPumpsParams:
     report: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DabPumpsConfig:
     id: str
     label: str
@@ -73,14 +85,14 @@ class DabPumpsConfig:
         Custom processing in case the dataclass was constructed from a dict
         status = DabPumpsConfig(**dict)
         """
-        for meta_key in self.meta_params:
-            meta_param = self.meta_params[meta_key]
-
-            if meta_param and isinstance(meta_param, dict):
-                self.meta_params[meta_key] = DabPumpsParams(**meta_param)
+        # Iterate items() directly instead of key lookup per entry; replacing
+        # values for existing keys during iteration is safe
+        for meta_key, meta_param in self.meta_params.items():
+            if type(meta_param) is dict:
+                self.meta_params[meta_key] = DabPumpsParams.from_dict(meta_param)
 
 
-@dataclass
+@dataclass(slots=True)
 class DabPumpsStatus:
     serial: str
     key: str
@@ -103,7 +115,7 @@ class DabPumpsStatus:
             self.update_ts = datetime.fromisoformat(self.update_ts)
 
 
-@dataclass
+@dataclass(slots=True)
 class DabPumpsHistoryItem:
     ts: datetime
     op: str
@@ -116,26 +128,28 @@ class DabPumpsHistoryItem:
             op = context,
         )
 
-        # If possible, add a summary of the response status and json res and code
+        # If possible, add a summary of the response status and json res and code.
+        # Built as a generator straight into join; no intermediate list needed.
         if response:
-            rsp_parts = []
-            if "status_code" in response:
-                rsp_parts.append(response["status_code"])
-            if "status" in response:
-                rsp_parts.append(response["status"])
-            
-            if json := response.get("json", None):
-                if res := json.get('res', ''): rsp_parts.append(f"res={res}")
-                if code := json.get('code', ''): rsp_parts.append(f"code={code}")
-                if msg := json.get('msg', ''): rsp_parts.append(f"msg={msg}")
-                if details := json.get('details', ''): rsp_parts.append(f"details={details}")
-
-            item.rsp = ', '.join(rsp_parts)
+            json_body = response.get("json", None) or {}
+            res = json_body.get('res', '')
+            code = json_body.get('code', '')
+            msg = json_body.get('msg', '')
+            details = json_body.get('details', '')
+
+            item.rsp = ', '.join( str(p) for p in (
+                response.get("status_code"),
+                response.get("status"),
+                f"res={res}" if res else None,
+                f"code={code}" if code else None,
+                f"msg={msg}" if msg else None,
+                f"details={details}" if details else None,
+            ) if p is not None )
 
         return item
 
 
-@dataclass
+@dataclass(slots=True)
 class DabPumpsHistoryDetail:
     ts: datetime
     req: dict|None
@@ -153,6 +167,26 @@ class DabPumpsHistoryDetail:
         return detail
 
 
+def _make_from_dict(cls):
+    """
+    Generate a specialized from_dict constructor for a dataclass.
+    The generated function is straight-line code without per-call reflection
+    (similar to what dataclasses generates for __init__ itself) and ignores
+    keys in the dict that are not fields of the class.
+    """
+    args = ", ".join(f"{f.name}=d.get({f.name!r})" for f in dataclass_fields(cls))
+    ns = {"cls": cls}
+    exec(f"def from_dict(d):\n    return cls({args})", ns)
+    return staticmethod(ns["from_dict"])
+
+
+DabPumpsInstall.from_dict = _make_from_dict(DabPumpsInstall)
+DabPumpsDevice.from_dict = _make_from_dict(DabPumpsDevice)
+DabPumpsParams.from_dict = _make_from_dict(DabPumpsParams)
+DabPumpsConfig.from_dict = _make_from_dict(DabPumpsConfig)
+DabPumpsStatus.from_dict = _make_from_dict(DabPumpsStatus)
+
+
 class DabPumpsDictFactory:
     @staticmethod
     def exclude_none_values(x):
@@ -1,3 +1,4 @@
+import aiohttp
 import asyncio
 import copy
 from datetime import datetime
@@ -5,10 +6,13 @@ import logging
 import pytest
 import pytest_asyncio
 
+from aiodabpumps.dabpumps_client import DabPumpsClient_Base
+
 from aiodabpumps import (
     DabPumpsApi,
     DabPumpsApiAuthError,
-    DabPumpsApiError, 
+    DabPumpsApiConnectError,
+    DabPumpsApiError,
     DabPumpsInstall,
     DabPumpsDevice,
     DabPumpsConfig,
@@ -375,7 +379,7 @@ async def test_set_data(method, key, codes, exp_code, exp_except, request):
         await context.api.async_fetch_install_details(install_id)
 
     # Find current code and value and find a new code to change into
-    status = next( (status for status in context.api.status_map.values() if status.key==key), None)
+    status = context.api.get_status_by_key(key)
     assert status is not None
 
     old_code = status.code
@@ -387,7 +391,7 @@ async def test_set_data(method, key, codes, exp_code, exp_except, request):
     if changed:
         await context.api.async_fetch_install_statuses(install_id)
 
-        status = next( (status for status in context.api.status_map.values() if status.key==key), None)
+        status = context.api.get_status_by_key(key)
         assert status.code == new_code
         assert status.update_ts is not None
         _LOGGER.debug(f"Found value changed from {old_code} to {new_code}")
@@ -400,7 +404,7 @@ async def test_set_data(method, key, codes, exp_code, exp_except, request):
     # Test after change has been processed by backend
     await context.api.async_fetch_install_statuses(install_id)
 
-    status = next( (status for status in context.api.status_map.values() if status.key==key), None)
+    status = context.api.get_status_by_key(key)
     assert status.code == new_code if exp_code == "=" else exp_code
     assert status.update_ts is None
 
@@ -411,7 +415,7 @@ async def test_set_data(method, key, codes, exp_code, exp_except, request):
     if changed:
         await context.api.async_fetch_install_statuses(install_id)
 
-        status = next( (status for status in context.api.status_map.values() if status.key==key), None)
+        status = context.api.get_status_by_key(key)
         assert status.code == old_code
         assert status.update_ts is not None
 
@@ -735,3 +739,110 @@ async def test_metadata(name, serial, key, translate, exp_type, exp_values, exp_
             for k,v in exp_values.items():
                 assert k in params.values
                 assert params.values[k] == v
+
+
+class StubDabPumpsClient(DabPumpsClient_Base):
+    """
+    Scripted client that replays canned responses (or raises canned exceptions),
+    used to test the _async_send_request retry and 304 handling without network access
+    """
+
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.requests = []
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def async_close(self):
+        self._closed = True
+
+    async def async_send_request(self, request):
+        self.requests.append(copy.deepcopy(request))
+
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return (request, copy.deepcopy(outcome))
+
+    async def async_get_cookie(self, domain, name):
+        return None
+
+    async def async_set_cookie(self, domain, name, value):
+        pass
+
+    async def async_clear_cookies(self):
+        pass
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("context")
+@pytest.mark.parametrize(
+    "name, outcomes, exp_result, exp_requests, exp_except",
+    [
+        ("ok", [
+            {"success": True,  "status": "200 OK", "headers": {}, "json": {"res": "OK", "value": 1}},
+         ], {"res": "OK", "value": 1}, 1, None),
+        ("5xx retried", [
+            {"success": False, "status": "500 Internal Server Error", "headers": {}, "text": "err"},
+            {"success": True,  "status": "200 OK", "headers": {}, "json": {"res": "OK", "value": 1}},
+         ], {"res": "OK", "value": 1}, 2, None),
+        ("transport error retried", [
+            aiohttp.ClientError("connection reset"),
+            {"success": True,  "status": "200 OK", "headers": {}, "json": {"res": "OK", "value": 1}},
+         ], {"res": "OK", "value": 1}, 2, None),
+        ("4xx fatal", [
+            {"success": False, "status": "404 Not Found", "headers": {}, "text": ""},
+         ], None, 1, DabPumpsApiConnectError),
+        ("401 fatal", [
+            {"success": False, "status": "401 Unauthorized", "headers": {}, "text": ""},
+         ], None, 1, DabPumpsApiAuthError),
+    ]
+)
+async def test_send_request(name, outcomes, exp_result, exp_requests, exp_except, request, monkeypatch):
+    context = request.getfixturevalue("context")
+    context.api = DabPumpsApi("dummy_usr", "wrong_pwd") # no login needed
+    context.api._client = StubDabPumpsClient(outcomes)
+
+    # Don't wait out the real retry backoff (1-2s per attempt); just record it
+    backoffs = []
+    async def _no_sleep(delay):
+        backoffs.append(delay)
+    monkeypatch.setattr(asyncio, "sleep", _no_sleep)
+
+    if exp_except is None:
+        result = await context.api._async_send_request("test", {"method": "GET", "url": "https://stub.test/endpoint"})
+        assert result == exp_result
+    else:
+        with pytest.raises(exp_except):
+            await context.api._async_send_request("test", {"method": "GET", "url": "https://stub.test/endpoint"})
+
+    assert len(context.api._client.outcomes) == 0
+    assert len(context.api._client.requests) == exp_requests
+    assert len(backoffs) == exp_requests - 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("context")
+async def test_send_request_etag(request):
+    context = request.getfixturevalue("context")
+    context.api = DabPumpsApi("dummy_usr", "wrong_pwd") # no login needed
+    context.api._client = StubDabPumpsClient([
+        {"success": True,  "status": "200 OK", "headers": {"ETag": '"v1"'}, "json": {"res": "OK", "value": 1}},
+        {"success": False, "status": "304 Not Modified", "headers": {}, "text": ""},
+    ])
+
+    # First GET caches the result alongside its ETag; the repeated GET is answered
+    # with '304 Not Modified' (reported as not-success by httpx) and must transparently
+    # return the cached result instead of raising
+    url = "https://stub.test/endpoint"
+    result1 = await context.api._async_send_request("test", {"method": "GET", "url": url})
+    result2 = await context.api._async_send_request("test", {"method": "GET", "url": url})
+
+    assert result1 == {"res": "OK", "value": 1}
+    assert result2 == result1
+
+    # The repeated GET must have carried the remembered ETag as conditional header
+    assert context.api._client.requests[1]["headers"].get("If-None-Match") == '"v1"'
@@ -100,3 +100,30 @@ async def test_dict():
     status_object2 = DabPumpsStatus(**status_dict2)
     assert status_object1 == status_obj1
     assert status_object2 == status_obj2
+
+
+async def test_from_dict():
+
+    install_obj = DabPumpsInstall(id="tst_id", name="tst_name", description="tst_descr", company="tst_company", address="tst_address", role=DabPumpsUserRole.INSTALLER, devices=2)
+    param_obj = DabPumpsParams(key="tst_key", name="tst_name", type=DabPumpsParamType.MEASURE, unit="tst", weight=10, values={"1":"one","2":"two"}, min=None, max=None, family="tst_family", group="tst_group", view="ci", change="", log="", report="")
+    config_obj = DabPumpsConfig(id="tst_id", label="tst_label", description="tst_descr", meta_params={"param_key": param_obj})
+    status_obj = DabPumpsStatus(serial="tst_serial", key="tst_key", name="tst_name", code="1", value="one", unit="tst_unit", status_ts=datetime.now(), update_ts=None )
+
+    # Convert obj into dict and back via the generated from_dict constructors
+    install_object = DabPumpsInstall.from_dict(asdict(install_obj))
+    assert install_object == install_obj
+
+    param_object = DabPumpsParams.from_dict(asdict(param_obj))
+    assert param_object == param_obj
+
+    config_object = DabPumpsConfig.from_dict(asdict(config_obj))
+    assert config_object == config_obj
+
+    status_object = DabPumpsStatus.from_dict(asdict(status_obj))
+    assert status_object == status_obj
+
+    # Keys that are not fields of the class are ignored
+    param_dict = asdict(param_obj)
+    param_dict["unexpected"] = "extra"
+    param_object = DabPumpsParams.from_dict(param_dict)
+    assert param_object == param_obj